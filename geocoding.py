@@ -8,25 +8,475 @@ Kakao / Naver API를 사용한 지오코딩 및 역지오코딩 모듈
 공개 함수는 데이터프레임(엑셀/CSV 로딩 결과)을 입력으로 받아 변환 결과 컬럼을 추가합니다.
 - geocode: 주소 → (경도, 위도)
 - reverse_geocode: (경도, 위도) → (도로명/지번 주소 및 상세 정보)
+- geocode_file / reverse_geocode_file: 대용량 CSV 파일을 청크 단위로 읽어 처리
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Protocol, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from tqdm.auto import tqdm
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈을 사용합니다.
+    orjson = None
+
+
+# Kakao 역지오코딩 응답 필드 매핑: (결과 키, 응답 키)
+_KAKAO_ROAD_FIELDS = (
+    ("road_address", "address_name"),
+    ("road_zone_no", "zone_no"),
+)
+_KAKAO_ROAD_DETAIL_FIELDS = (
+    ("road_region_1depth", "region_1depth_name"),
+    ("road_region_2depth", "region_2depth_name"),
+    ("road_region_3depth", "region_3depth_name"),
+    ("road_name", "road_name"),
+    ("road_main_building_no", "main_building_no"),
+    ("road_sub_building_no", "sub_building_no"),
+    ("road_building_name", "building_name"),
+    ("road_underground_yn", "underground_yn"),
+)
+_KAKAO_ADDRESS_FIELDS = (("address", "address_name"),)
+_KAKAO_ADDRESS_DETAIL_FIELDS = (
+    ("address_region_1depth", "region_1depth_name"),
+    ("address_region_2depth", "region_2depth_name"),
+    ("address_region_3depth", "region_3depth_name"),
+    ("address_region_3depth_h", "region_3depth_h_name"),
+    ("address_h_code", "h_code"),
+    ("address_b_code", "b_code"),
+    ("address_main_no", "main_address_no"),
+    ("address_sub_no", "sub_address_no"),
+    ("address_mountain_yn", "mountain_yn"),
+)
+
+# include_details=True일 때 추가되는 상세 컬럼 (provider 공통, road_address를 뺀 위 매핑 순서)
+_DETAIL_COLUMNS = tuple(
+    out
+    for out, _ in (
+        _KAKAO_ROAD_FIELDS[1:] + _KAKAO_ROAD_DETAIL_FIELDS + _KAKAO_ADDRESS_DETAIL_FIELDS
+    )
+)
+
+
+class TokenBucket:
+    """
+    스레드 간 공유되는 토큰 버킷 방식 호출 속도 제한기
+
+    capacity만큼은 즉시 호출(버스트)할 수 있고, 이후에는 초당 rate_per_sec회로 제한합니다.
+    rate_per_sec가 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: Optional[int] = None):
+        self._lock = threading.Lock()
+        self.configure(rate_per_sec, capacity)
+
+    def configure(self, rate_per_sec: float, capacity: Optional[int] = None) -> None:
+        with self._lock:
+            self.rate = rate_per_sec
+            self.capacity = capacity or max(1, int(rate_per_sec))
+            self.tokens = float(self.capacity)
+            self.last = time.monotonic()
+
+    def set_rate(self, rate_per_sec: float) -> None:
+        """속도가 바뀔 때만 재설정 (같은 속도면 버킷을 채우지 않아 동시 작업의 속도 제한 유지)"""
+        if rate_per_sec != self.rate:
+            self.configure(rate_per_sec)
+
+    def acquire(self) -> None:
+        """토큰 1개를 얻을 때까지 대기"""
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """acquire의 비동기 버전 (이벤트 루프를 막지 않고 대기)"""
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def _try_acquire(self) -> float:
+        """토큰을 얻으면 0, 아니면 다음 토큰까지 기다릴 시간(초)을 반환"""
+        if self.rate <= 0:
+            return 0
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+
+class GeoCache:
+    """
+    SQLite 기반 지오코딩/역지오코딩 결과 영구 캐시
+
+    프로그램을 다시 실행해도 같은 주소/좌표는 API 호출 없이 재사용합니다.
+    성공한 결과만 저장하며, ttl(초)이 지난 항목은 무시합니다 (None이면 만료 없음).
+
+    예:
+        cache = GeoCache()
+        result = geocode(df, "주소", cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = "~/.cache/kakao_geocoding.sqlite",
+        ttl: Optional[float] = 30 * 24 * 3600,
+    ):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # 작업자 스레드들이 하나의 연결을 공유하므로 접근은 _lock으로 직렬화합니다.
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, ts INTEGER)"
+        )
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, ts FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, ts = row
+        if self.ttl is not None and time.time() - ts >= self.ttl:
+            return None
+        return _json_loads(value)
+
+    def set(self, key: str, value: dict) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                (key, _json_dumps(value), int(time.time())),
+            )
+
+    @contextmanager
+    def batch(self) -> Iterator["GeoCache"]:
+        """블록 안의 set 호출을 하나의 트랜잭션으로 묶어 커밋"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+        try:
+            yield self
+        except BaseException:
+            with self._lock:
+                self._conn.execute("ROLLBACK")
+            raise
+        with self._lock:
+            self._conn.execute("COMMIT")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class _GeocodingAPIBase:
+    """provider 공통 요청 처리 (세션, 속도 제한, 메모리 캐시, 인증 오류 처리)
 
+    하위 클래스는 URL과 인증 상태 코드, 요청 파라미터/응답 파싱, 인증 오류 출력만 정의합니다.
+    """
+
+    NAME = ""
+    _GEOCODE_URL = ""
+    _REVGEO_URL = ""
+    # 초당 호출 수 기본값 (geocode/reverse_geocode에서는 delay로 재설정됩니다)
+    RATE_PER_SEC = 10.0
+    # 인증 오류로 보고 남은 요청을 중단할 HTTP 상태 코드
+    _AUTH_STATUSES: Tuple[int, ...] = (403,)
+    # 오류 메시지에 붙는 provider 표시 (예: "(Naver)")
+    _ERROR_LABEL = ""
+
+    def __init__(self, headers: Dict[str, str]):
+        self.headers = headers
+        self.session = _create_session(self.headers)
+        self.rate_limiter = TokenBucket(self.RATE_PER_SEC)
+        # 인증 오류(403 등)를 한 번 받으면 True가 되어 이후 요청을 보내지 않습니다.
+        # 진행 중인 작업이 하나도 없을 때 새 작업이 시작되면 초기화됩니다 (_job 참고).
+        self._auth_failed = False
+        self._auth_lock = threading.Lock()
+        self._active_jobs = 0
+
+    @contextmanager
+    def _job(self) -> Iterator[None]:
+        """geocode/reverse_geocode 작업 구간 (동시에 실행 중인 다른 작업의 인증 실패 상태는 유지)"""
+        with self._auth_lock:
+            if self._active_jobs == 0:
+                self._auth_failed = False
+            self._active_jobs += 1
+        try:
+            yield
+        finally:
+            with self._auth_lock:
+                self._active_jobs -= 1
+
+    def _handle_auth_error(self, response: Any, context: str) -> None:
+        """인증 오류 응답 처리: 최초 1회만 상세 내용을 출력하고 이후 요청을 중단"""
+        with self._auth_lock:
+            if self._auth_failed:
+                return
+            self._auth_failed = True
+        self._print_auth_error(response, context)
+        print("인증 오류로 이번 작업의 남은 요청은 보내지 않습니다.")
+
+    def _print_auth_error(self, response: Any, context: str) -> None:
+        raise NotImplementedError
+
+    def geocode_address(self, address: str, use_cache: bool = True) -> Optional[dict]:
+        """주소를 좌표로 변환 (단일 주소, 결측값은 호출 측에서 걸러서 전달)"""
+        key = _normalize_address(address)
+        if not key:
+            return None
+        try:
+            if use_cache:
+                return _cached_geocode_address(self, key)
+            return self._request_geocode(key)
+        except _RequestFailed:
+            return None
 
-class KakaoGeocodingAPI:
+    def reverse_geocode_coords(
+        self,
+        longitude: float,
+        latitude: float,
+        include_details: bool = True,
+        save_json: Optional[str] = None,
+        save_fp: Optional[_BytesWriter] = None,
+        timestamp: Optional[str] = None,
+        save_headers: bool = False,
+        use_cache: bool = True,
+    ) -> Optional[dict]:
+        """좌표를 주소로 변환 (단일 좌표, 결측 좌표는 호출 측에서 걸러서 전달)"""
+        try:
+            # JSON 저장은 호출마다 기록되어야 하므로 캐시를 거치지 않습니다.
+            if use_cache and not (save_json or save_fp):
+                coord = _CoordKey(longitude, latitude)
+                return _cached_reverse_geocode_coords(self, coord, include_details)
+            return self._request_reverse_geocode(
+                longitude,
+                latitude,
+                include_details,
+                save_json,
+                save_fp,
+                timestamp,
+                save_headers,
+            )
+        except _RequestFailed:
+            return None
+
+    def _request_geocode(self, address: str) -> Optional[dict]:
+        if self._auth_failed:
+            raise _RequestFailed
+
+        params = self._geocode_params(address)
+        try:
+            self.rate_limiter.acquire()
+            response = self.session.get(self._GEOCODE_URL, params=params)
+            return self._handle_geocode_response(response, address)
+        except _RequestFailed:
+            raise
+        except Exception as e:
+            print(f"지오코딩 오류{self._ERROR_LABEL} (주소: {address}): {str(e)}")
+            raise _RequestFailed from e
+
+    async def geocode_address_async(self, client: Any, address: str) -> Optional[dict]:
+        """geocode_address의 비동기 버전 (httpx.AsyncClient 사용, 메모리 캐시 미사용)"""
+        if self._auth_failed:
+            return None
+
+        params = self._geocode_params(address)
+        try:
+            await self.rate_limiter.acquire_async()
+            response = await client.get(self._GEOCODE_URL, params=params)
+            return self._handle_geocode_response(response, address)
+        except _RequestFailed:
+            return None
+        except Exception as e:
+            print(f"지오코딩 오류{self._ERROR_LABEL} (주소: {address}): {str(e)}")
+            return None
+
+    def _handle_geocode_response(self, response: Any, address: str) -> Optional[dict]:
+        """지오코딩 응답 처리 (requests/httpx 응답 공통, 오류 응답이면 _RequestFailed)"""
+        status = response.status_code
+        if status in self._AUTH_STATUSES:
+            self._handle_auth_error(response, context="지오코딩")
+            raise _RequestFailed
+        if status != 200:
+            print(f"지오코딩 HTTP 오류{self._ERROR_LABEL} (주소: {address}): {status}")
+            raise _RequestFailed
+
+        return self._parse_geocode(_json_loads(response.content))
+
+    def _request_reverse_geocode(
+        self,
+        longitude: float,
+        latitude: float,
+        include_details: bool = True,
+        save_json: Optional[str] = None,
+        save_fp: Optional[_BytesWriter] = None,
+        timestamp: Optional[str] = None,
+        save_headers: bool = False,
+    ) -> Optional[dict]:
+        if self._auth_failed:
+            raise _RequestFailed
+
+        params = self._reverse_params(longitude, latitude)
+        try:
+            self.rate_limiter.acquire()
+            response = self.session.get(self._REVGEO_URL, params=params)
+            return self._handle_reverse_response(
+                response,
+                params,
+                longitude,
+                latitude,
+                include_details,
+                save_json,
+                save_fp,
+                timestamp,
+                save_headers,
+            )
+        except _RequestFailed:
+            raise
+        except Exception as e:
+            print(f"역지오코딩 오류{self._ERROR_LABEL} (좌표: {longitude}, {latitude}): {str(e)}")
+            raise _RequestFailed from e
+
+    async def reverse_geocode_coords_async(
+        self,
+        client: Any,
+        longitude: float,
+        latitude: float,
+        include_details: bool = True,
+        save_json: Optional[str] = None,
+        save_fp: Optional[_BytesWriter] = None,
+        timestamp: Optional[str] = None,
+        save_headers: bool = False,
+    ) -> Optional[dict]:
+        """reverse_geocode_coords의 비동기 버전 (httpx.AsyncClient 사용, 메모리 캐시 미사용)"""
+        if self._auth_failed:
+            return None
+
+        params = self._reverse_params(longitude, latitude)
+        try:
+            await self.rate_limiter.acquire_async()
+            response = await client.get(self._REVGEO_URL, params=params)
+            return self._handle_reverse_response(
+                response,
+                params,
+                longitude,
+                latitude,
+                include_details,
+                save_json,
+                save_fp,
+                timestamp,
+                save_headers,
+            )
+        except _RequestFailed:
+            return None
+        except Exception as e:
+            print(f"역지오코딩 오류{self._ERROR_LABEL} (좌표: {longitude}, {latitude}): {str(e)}")
+            return None
+
+    def _handle_reverse_response(
+        self,
+        response: Any,
+        params: Dict[str, Any],
+        longitude: float,
+        latitude: float,
+        include_details: bool,
+        save_json: Optional[str],
+        save_fp: Optional[_BytesWriter],
+        timestamp: Optional[str],
+        save_headers: bool,
+    ) -> Optional[dict]:
+        """역지오코딩 응답 처리 (requests/httpx 응답 공통): 상태 확인, JSON 저장, 파싱
+
+        오류 응답이면 _RequestFailed를 발생시킵니다.
+        """
+        status = response.status_code
+        if status in self._AUTH_STATUSES:
+            self._handle_auth_error(response, context="역지오코딩")
+            raise _RequestFailed
+        if status != 200:
+            print(
+                f"역지오코딩 HTTP 오류{self._ERROR_LABEL} "
+                f"(좌표: {longitude}, {latitude}): {status}"
+            )
+            raise _RequestFailed
+
+        data = _json_loads(response.content)
+
+        if save_json or save_fp:
+            _save_api_json(
+                save_json=save_json,
+                save_fp=save_fp,
+                timestamp=timestamp,
+                save_headers=save_headers,
+                request_url=self._REVGEO_URL,
+                request_params=params,
+                longitude=longitude,
+                latitude=latitude,
+                response=response,
+                data=data,
+            )
+
+        return self._parse_reverse_geocode(data, include_details)
+
+    @staticmethod
+    def _geocode_params(address: str) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    @staticmethod
+    def _parse_geocode(data: Any) -> Optional[dict]:
+        raise NotImplementedError
+
+    @staticmethod
+    def _reverse_params(longitude: float, latitude: float) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    @staticmethod
+    def _parse_reverse_geocode(data: Any, include_details: bool) -> Optional[dict]:
+        raise NotImplementedError
+
+
+class KakaoGeocodingAPI(_GeocodingAPIBase):
     """카카오 지오코딩 API 클래스 (내부 사용)"""
 
+    NAME = "kakao"
     BASE_URL = "https://dapi.kakao.com/v2/local"
+    _GEOCODE_URL = BASE_URL + "/search/address.json"
+    _REVGEO_URL = BASE_URL + "/geo/coord2address.json"
+    _AUTH_STATUSES = (403,)
 
     def __init__(self, api_key: Optional[str] = None):
         if api_key is None:
@@ -44,150 +494,57 @@ class KakaoGeocodingAPI:
                     )
 
         self.api_key = api_key
-        self.headers = {"Authorization": f"KakaoAK {self.api_key}"}
-
-    def geocode_address(self, address: str) -> Optional[dict]:
-        """주소를 좌표로 변환 (단일 주소)"""
-        if pd.isna(address) or address == "":
-            return None
+        super().__init__({"Authorization": f"KakaoAK {self.api_key}"})
 
-        url = f"{self.BASE_URL}/search/address.json"
-        params = {"query": str(address), "size": 1}
-
-        try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-
-            if response.status_code == 403:
-                _print_kakao_403_details(response, self.api_key, context="지오코딩")
-
-            response.raise_for_status()
-            data = response.json()
-
-            documents = data.get("documents", [])
-            if documents:
-                doc = documents[0]
-                return {
-                    "longitude": float(doc.get("x", 0) or 0),
-                    "latitude": float(doc.get("y", 0) or 0),
-                    "address_name": doc.get("address_name", ""),
-                    "address_type": doc.get("address_type", ""),
-                }
-        except requests.exceptions.HTTPError as e:
-            if getattr(e.response, "status_code", None) != 403:
-                print(f"지오코딩 HTTP 오류 (주소: {address}): {str(e)}")
-        except Exception as e:
-            print(f"지오코딩 오류 (주소: {address}): {str(e)}")
+    def _print_auth_error(self, response: Any, context: str) -> None:
+        _print_kakao_403_details(response, self.api_key, context=context)
 
-        return None
+    @staticmethod
+    def _geocode_params(address: str) -> Dict[str, Any]:
+        return {"query": address if isinstance(address, str) else str(address), "size": 1}
 
-    def reverse_geocode_coords(
-        self,
-        longitude: float,
-        latitude: float,
-        include_details: bool = True,
-        save_json: Optional[str] = None,
-    ) -> Optional[dict]:
-        """좌표를 주소로 변환 (단일 좌표)"""
-        if pd.isna(longitude) or pd.isna(latitude):
+    @staticmethod
+    def _parse_geocode(data: Dict[str, Any]) -> Optional[dict]:
+        documents = data.get("documents", [])
+        if not documents:
             return None
 
-        url = f"{self.BASE_URL}/geo/coord2address.json"
-        params = {"x": str(longitude), "y": str(latitude), "input_coord": "WGS84"}
+        doc = documents[0]
+        return {
+            "longitude": float(doc.get("x", 0) or 0),
+            "latitude": float(doc.get("y", 0) or 0),
+            "address_name": doc.get("address_name", ""),
+            "address_type": doc.get("address_type", ""),
+        }
+
+    @staticmethod
+    def _reverse_params(longitude: float, latitude: float) -> Dict[str, Any]:
+        return {"x": str(longitude), "y": str(latitude), "input_coord": "WGS84"}
 
-        try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-
-            if response.status_code == 403:
-                _print_kakao_403_details(response, self.api_key, context="역지오코딩")
-
-            response.raise_for_status()
-            data = response.json()
-
-            if save_json:
-                _save_api_json(
-                    save_json=save_json,
-                    request_url=url,
-                    request_params=params,
-                    longitude=longitude,
-                    latitude=latitude,
-                    response=response,
-                    data=data,
-                )
+    @staticmethod
+    def _parse_reverse_geocode(data: Dict[str, Any], include_details: bool) -> Optional[dict]:
+        documents = data.get("documents", [])
+        if not documents:
+            return None
 
-            documents = data.get("documents", [])
-            if not documents:
-                return None
-
-            doc = documents[0]
-            result: Dict[str, Any] = {}
-
-            # 도로명 주소 정보
-            if "road_address" in doc and doc["road_address"]:
-                road = doc["road_address"]
-                result["road_address"] = road.get("address_name", "")
-                result["road_zone_no"] = road.get("zone_no", "")
-
-                if include_details:
-                    result["road_region_1depth"] = road.get("region_1depth_name", "")
-                    result["road_region_2depth"] = road.get("region_2depth_name", "")
-                    result["road_region_3depth"] = road.get("region_3depth_name", "")
-                    result["road_name"] = road.get("road_name", "")
-                    result["road_main_building_no"] = road.get("main_building_no", "")
-                    result["road_sub_building_no"] = road.get("sub_building_no", "")
-                    result["road_building_name"] = road.get("building_name", "")
-                    result["road_underground_yn"] = road.get("underground_yn", "")
-            else:
-                result["road_address"] = ""
-                result["road_zone_no"] = ""
-                if include_details:
-                    result["road_region_1depth"] = ""
-                    result["road_region_2depth"] = ""
-                    result["road_region_3depth"] = ""
-                    result["road_name"] = ""
-                    result["road_main_building_no"] = ""
-                    result["road_sub_building_no"] = ""
-                    result["road_building_name"] = ""
-                    result["road_underground_yn"] = ""
-
-            # 지번 주소 정보
-            if "address" in doc and doc["address"]:
-                addr = doc["address"]
-                result["address"] = addr.get("address_name", "")
-
-                if include_details:
-                    result["address_region_1depth"] = addr.get("region_1depth_name", "")
-                    result["address_region_2depth"] = addr.get("region_2depth_name", "")
-                    result["address_region_3depth"] = addr.get("region_3depth_name", "")
-                    result["address_region_3depth_h"] = addr.get("region_3depth_h_name", "")
-                    result["address_h_code"] = addr.get("h_code", "")
-                    result["address_b_code"] = addr.get("b_code", "")
-                    result["address_main_no"] = addr.get("main_address_no", "")
-                    result["address_sub_no"] = addr.get("sub_address_no", "")
-                    result["address_mountain_yn"] = addr.get("mountain_yn", "")
-            else:
-                result["address"] = ""
-                if include_details:
-                    result["address_region_1depth"] = ""
-                    result["address_region_2depth"] = ""
-                    result["address_region_3depth"] = ""
-                    result["address_region_3depth_h"] = ""
-                    result["address_h_code"] = ""
-                    result["address_b_code"] = ""
-                    result["address_main_no"] = ""
-                    result["address_sub_no"] = ""
-                    result["address_mountain_yn"] = ""
-
-            return result
-        except requests.exceptions.HTTPError as e:
-            if getattr(e.response, "status_code", None) != 403:
-                print(f"역지오코딩 HTTP 오류 (좌표: {longitude}, {latitude}): {str(e)}")
-        except Exception as e:
-            print(f"역지오코딩 오류 (좌표: {longitude}, {latitude}): {str(e)}")
+        doc = documents[0]
+        # 도로명/지번 주소가 없으면 빈 dict → 모든 필드가 ""로 채워집니다.
+        road = doc.get("road_address") or {}
+        addr = doc.get("address") or {}
+
+        result: Dict[str, Any] = {out: road.get(src, "") for out, src in _KAKAO_ROAD_FIELDS}
+        if include_details:
+            result.update({out: road.get(src, "") for out, src in _KAKAO_ROAD_DETAIL_FIELDS})
+        result.update({out: addr.get(src, "") for out, src in _KAKAO_ADDRESS_FIELDS})
+        if include_details:
+            result.update(
+                {out: addr.get(src, "") for out, src in _KAKAO_ADDRESS_DETAIL_FIELDS}
+            )
 
-        return None
+        return result
 
 
-class NaverGeocodingAPI:
+class NaverGeocodingAPI(_GeocodingAPIBase):
     """
     네이버 지도(NCP) 지오코딩/역지오코딩 API 클래스 (내부 사용)
 
@@ -196,10 +553,15 @@ class NaverGeocodingAPI:
     - NAVER_MAPS_API_KEY: X-NCP-APIGW-API-KEY
     """
 
+    NAME = "naver"
     # NCP Maps API 문서 기준 Base URL
     # - Geocoding: https://maps.apigw.ntruss.com/map-geocode/v2
     # - Reverse Geocoding: https://maps.apigw.ntruss.com/map-reversegeocode/v2
     BASE_URL = "https://maps.apigw.ntruss.com"
+    _GEOCODE_URL = BASE_URL + "/map-geocode/v2/geocode"
+    _REVGEO_URL = BASE_URL + "/map-reversegeocode/v2/gc"
+    _AUTH_STATUSES = (401, 403)
+    _ERROR_LABEL = "(Naver)"
 
     def __init__(self, api_key_id: Optional[str] = None, api_key: Optional[str] = None):
         if api_key_id is None:
@@ -234,7 +596,7 @@ class NaverGeocodingAPI:
 
         self.api_key_id = api_key_id
         self.api_key = api_key
-        self.headers = {
+        headers = {
             # NCP 문서 예시(curl) 기준으로 소문자 헤더를 사용합니다.
             # (HTTP 헤더는 원칙적으로 대소문자 무관하지만, 일부 게이트웨이/프록시에서
             # 케이스 이슈가 나는 사례가 있어 안전하게 맞춥니다.)
@@ -242,153 +604,201 @@ class NaverGeocodingAPI:
             "x-ncp-apigw-api-key": self.api_key,
             "accept": "application/json",
         }
+        super().__init__(headers)
 
-    def geocode_address(self, address: str) -> Optional[dict]:
-        if pd.isna(address) or address == "":
-            return None
+    def _print_auth_error(self, response: Any, context: str) -> None:
+        _print_naver_auth_error(response)
 
-        url = f"{self.BASE_URL}/map-geocode/v2/geocode"
-        params = {"query": str(address)}
+    @staticmethod
+    def _geocode_params(address: str) -> Dict[str, Any]:
+        return {"query": address if isinstance(address, str) else str(address)}
 
-        try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            if response.status_code in (401, 403):
-                _print_naver_auth_error(response)
-            response.raise_for_status()
-            data = response.json()
-
-            addresses = data.get("addresses", [])
-            if not addresses:
-                return None
-
-            first = addresses[0]
-            return {
-                "longitude": float(first.get("x", 0) or 0),
-                "latitude": float(first.get("y", 0) or 0),
-                "road_address": first.get("roadAddress", "") or "",
-                "address": first.get("jibunAddress", "") or "",
-            }
-        except requests.exceptions.HTTPError as e:
-            resp = getattr(e, "response", None)
-            if resp is not None and resp.status_code in (401, 403):
-                _print_naver_auth_error(resp)
-            print(
-                f"지오코딩 오류(Naver) (주소: {address}): "
-                f"{getattr(resp, 'status_code', 'unknown')} {str(e)}"
-            )
-            return None
-        except Exception as e:
-            print(f"지오코딩 오류(Naver) (주소: {address}): {str(e)}")
+    @staticmethod
+    def _parse_geocode(data: Dict[str, Any]) -> Optional[dict]:
+        addresses = data.get("addresses", [])
+        if not addresses:
             return None
 
-    def reverse_geocode_coords(
-        self,
-        longitude: float,
-        latitude: float,
-        include_details: bool = True,
-        save_json: Optional[str] = None,
-    ) -> Optional[dict]:
-        if pd.isna(longitude) or pd.isna(latitude):
-            return None
+        first = addresses[0]
+        return {
+            "longitude": float(first.get("x", 0) or 0),
+            "latitude": float(first.get("y", 0) or 0),
+            "road_address": first.get("roadAddress", "") or "",
+            "address": first.get("jibunAddress", "") or "",
+        }
 
-        url = f"{self.BASE_URL}/map-reversegeocode/v2/gc"
-        params = {
+    @staticmethod
+    def _reverse_params(longitude: float, latitude: float) -> Dict[str, Any]:
+        return {
             "coords": f"{longitude},{latitude}",
             "output": "json",
             # roadaddr, addr 순으로 시도 (권장 조합)
             "orders": "roadaddr,addr",
         }
 
-        try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            if response.status_code in (401, 403):
-                _print_naver_auth_error(response)
-            response.raise_for_status()
-            data = response.json()
-
-            if save_json:
-                _save_api_json(
-                    save_json=save_json,
-                    request_url=url,
-                    request_params=params,
-                    longitude=longitude,
-                    latitude=latitude,
-                    response=response,
-                    data=data,
-                )
-
-            results = (data.get("results") or []) if isinstance(data, dict) else []
-            if not results:
-                return None
-
-            road = _pick_naver_result(results, "roadaddr")
-            addr = _pick_naver_result(results, "addr")
-            base = road or addr or results[0]
-
-            out: Dict[str, Any] = {
-                "road_address": _naver_result_text(road) if road else "",
-                "address": _naver_result_text(addr) if addr else "",
-            }
-
-            if include_details:
-                # 공통 region 추출 (road 우선)
-                region = (base.get("region") or {}) if isinstance(base, dict) else {}
-                area1 = (region.get("area1") or {}).get("name", "")
-                area2 = (region.get("area2") or {}).get("name", "")
-                area3 = (region.get("area3") or {}).get("name", "")
-
-                out["road_zone_no"] = ""  # Naver reverse 응답엔 우편번호가 없거나 제한적이라 빈값
-                out["road_region_1depth"] = area1
-                out["road_region_2depth"] = area2
-                out["road_region_3depth"] = area3
-                out["road_name"] = _naver_road_name(road) if road else ""
-                out["road_main_building_no"] = ""
-                out["road_sub_building_no"] = ""
-                out["road_building_name"] = _naver_building_name(road) if road else ""
-                out["road_underground_yn"] = ""
-
-                out["address_region_1depth"] = area1
-                out["address_region_2depth"] = area2
-                out["address_region_3depth"] = area3
-                out["address_region_3depth_h"] = ""
-                out["address_h_code"] = ""
-                out["address_b_code"] = ""
-                out["address_main_no"] = ""
-                out["address_sub_no"] = ""
-                out["address_mountain_yn"] = ""
-
-            return out
-        except requests.exceptions.HTTPError as e:
-            resp = getattr(e, "response", None)
-            if resp is not None and resp.status_code in (401, 403):
-                _print_naver_auth_error(resp)
-            print(
-                f"역지오코딩 오류(Naver) (좌표: {longitude}, {latitude}): "
-                f"{getattr(resp, 'status_code', 'unknown')} {str(e)}"
-            )
-            return None
-        except Exception as e:
-            print(f"역지오코딩 오류(Naver) (좌표: {longitude}, {latitude}): {str(e)}")
+    @staticmethod
+    def _parse_reverse_geocode(data: Any, include_details: bool) -> Optional[dict]:
+        results = (data.get("results") or []) if isinstance(data, dict) else []
+        if not results:
             return None
 
+        # name별 첫 결과 (roadaddr/addr 조회용)
+        by_name: Dict[Any, dict] = {}
+        for r in results:
+            if isinstance(r, dict):
+                by_name.setdefault(r.get("name"), r)
+        road = by_name.get("roadaddr")
+        addr = by_name.get("addr")
+        base = road or addr or results[0]
+
+        out: Dict[str, Any] = {
+            "road_address": _naver_result_text(road) if road else "",
+            "address": _naver_result_text(addr) if addr else "",
+        }
+
+        if include_details:
+            # 공통 region 추출 (road 우선)
+            region = (base.get("region") or {}) if isinstance(base, dict) else {}
+            area1 = (region.get("area1") or {}).get("name", "")
+            area2 = (region.get("area2") or {}).get("name", "")
+            area3 = (region.get("area3") or {}).get("name", "")
+
+            # Naver 응답에 없는 필드(우편번호, 건물번호 등)는 빈값으로 둡니다.
+            out.update(dict.fromkeys(_DETAIL_COLUMNS, ""))
+            for prefix in ("road", "address"):
+                out[f"{prefix}_region_1depth"] = area1
+                out[f"{prefix}_region_2depth"] = area2
+                out[f"{prefix}_region_3depth"] = area3
+            out["road_name"] = _naver_road_name(road) if road else ""
+            out["road_building_name"] = _naver_building_name(road) if road else ""
+
+        return out
+
 
+def _normalize_address(address: Any) -> str:
+    """캐시 키용 주소 정규화 (앞뒤/중복 공백 제거)"""
+    return " ".join(str(address).strip().split())
+
+
+def _to_float_array(values: pd.Series) -> np.ndarray:
+    """좌표 컬럼을 float64 배열로 변환 (숫자가 아닌 값과 결측값은 NaN)"""
+    return pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _coord_key(longitude: float, latitude: float) -> Tuple[float, float]:
+    """캐시 키용 좌표 정규화 (소수점 6자리, 약 0.1m 단위로 부동소수 오차 제거)"""
+    return round(float(longitude), 6), round(float(latitude), 6)
+
+
+class _CoordKey:
+    """메모리 캐시용 좌표: 비교/해시는 _coord_key로 하고, 요청에는 처음 받은 원본 좌표를 사용"""
+
+    __slots__ = ("longitude", "latitude", "key")
+
+    def __init__(self, longitude: float, latitude: float):
+        self.longitude = longitude
+        self.latitude = latitude
+        self.key = _coord_key(longitude, latitude)
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _CoordKey) and self.key == other.key
+
+
+class _RequestFailed(Exception):
+    """
+    응답을 얻지 못한 요청 (네트워크/HTTP 오류, 인증 실패 등)
+
+    _request_* 메서드는 실패 시 None 대신 이 예외를 발생시켜 lru_cache에 실패가 저장되지 않게 하고,
+    geocode_address/reverse_geocode_coords에서 None으로 바꿔 반환합니다.
+    검색 결과가 없는 정상 응답(200)은 None을 반환하며 캐시됩니다.
+    """
+
+
+@lru_cache(maxsize=100_000)
+def _cached_geocode_address(api: Any, address: str) -> Optional[dict]:
+    return api._request_geocode(address)
+
+
+@lru_cache(maxsize=100_000)
+def _cached_reverse_geocode_coords(
+    api: Any, coord: _CoordKey, include_details: bool
+) -> Optional[dict]:
+    return api._request_reverse_geocode(coord.longitude, coord.latitude, include_details)
+
+
+def clear_cache() -> None:
+    """지오코딩/역지오코딩 결과 메모리 캐시 비우기"""
+    _cached_geocode_address.cache_clear()
+    _cached_reverse_geocode_coords.cache_clear()
+
+
+# API 요청 기본 타임아웃(초)
+_REQUEST_TIMEOUT = 10
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """요청에 timeout이 지정되지 않으면 기본 타임아웃을 적용하는 HTTPAdapter"""
+
+    def __init__(self, *args: Any, timeout: float = _REQUEST_TIMEOUT, **kwargs: Any):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request: Any, **kwargs: Any) -> requests.Response:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def _create_session(headers: Dict[str, str]) -> requests.Session:
+    """
+    Provider 인스턴스가 공유하는 HTTP 세션 생성
+
+    행마다 새 연결(TCP/TLS 핸드셰이크)을 맺지 않도록 keep-alive 커넥션 풀을 사용하고,
+    일시적인 오류(429/5xx)는 urllib3 Retry로 재시도합니다.
+    타임아웃은 어댑터에서 기본값(_REQUEST_TIMEOUT)을 적용하므로 호출마다 넘기지 않습니다.
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    )
+    adapter = _TimeoutHTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+# Provider 인스턴스(및 세션)는 프로세스 내에서 재사용됩니다.
 _provider_instances: Dict[str, Any] = {}
+_provider_lock = threading.Lock()
 
 
 def _get_provider(provider: str):
+    """
+    provider별 API 인스턴스(싱글턴) 반환
+
+    프로세스당 provider마다 인스턴스 하나(= HTTP 세션/커넥션 풀 하나)를 공유합니다.
+    API 키는 처음 생성될 때 읽으므로, 이후 환경변수/config.py를 바꿔도 모듈을 재로드하기 전까지는 반영되지 않습니다.
+    """
     p = (provider or "kakao").strip().lower()
     if p not in ("kakao", "naver"):
         raise ValueError("provider는 'kakao' 또는 'naver'만 지원합니다.")
 
-    if p in _provider_instances:
-        return _provider_instances[p]
+    inst = _provider_instances.get(p)
+    if inst is not None:
+        return inst
 
-    if p == "kakao":
-        inst = KakaoGeocodingAPI()
-    else:
-        inst = NaverGeocodingAPI()
-
-    _provider_instances[p] = inst
+    # 여러 스레드가 동시에 처음 호출해도 인스턴스(세션)가 하나만 만들어지도록 잠금 후 재확인
+    with _provider_lock:
+        inst = _provider_instances.get(p)
+        if inst is None:
+            inst = KakaoGeocodingAPI() if p == "kakao" else NaverGeocodingAPI()
+            _provider_instances[p] = inst
     return inst
 
 
@@ -399,6 +809,14 @@ def geocode(
     latitude_column: str = "latitude",
     delay: float = 0.1,
     provider: str = "kakao",
+    max_workers: int = 8,
+    inplace: bool = False,
+    backend: str = "thread",
+    cache: Optional[GeoCache] = None,
+    use_cache: bool = True,
+    validate_bounds: bool = False,
+    valid_column: str = "geo_valid",
+    verbose: bool = True,
 ) -> pd.DataFrame:
     """
     주소 컬럼을 좌표로 변환하여 데이터프레임에 추가
@@ -408,35 +826,76 @@ def geocode(
         address_column: 주소가 있는 컬럼명
         longitude_column: 경도 컬럼명
         latitude_column: 위도 컬럼명
-        delay: API 호출 간 지연 시간(초)
+        delay: API 호출 간 지연 시간(초), 초당 1/delay회로 호출 속도를 제한 (0이면 제한 없음)
         provider: 'kakao' | 'naver'
+        max_workers: 동시에 API를 호출할 스레드 수
+        inplace: True이면 입력 데이터프레임에 직접 컬럼을 추가
+            (False이면 전체 복사본을 만들므로 대용량 입력은 True가 메모리를 절약)
+        backend: 'thread' (requests + 스레드 풀) | 'async' (httpx HTTP/2, max_workers개 동시 요청)
+        cache: 결과를 재사용할 GeoCache (None이면 영구 캐시 미사용)
+        use_cache: False이면 메모리/영구 캐시를 건너뛰고 항상 API를 호출
+        validate_bounds: True이면 좌표가 대한민국 범위 안에 있는지 나타내는 bool 컬럼 추가
+        valid_column: 범위 검사 결과 컬럼명 (validate_bounds=True일 때만 사용)
+        verbose: 진행 표시줄과 시작/완료 메시지 출력 여부
     """
     if address_column not in df.columns:
         raise ValueError(f"컬럼 '{address_column}'이 데이터프레임에 없습니다.")
+    if backend not in ("thread", "async"):
+        raise ValueError("backend는 'thread' 또는 'async'만 지원합니다.")
 
-    df = df.copy()
+    if not inplace:
+        df = df.copy()
     api = _get_provider(provider)
+    api.rate_limiter.set_rate(1 / delay if delay > 0 else 0)
 
-    df[longitude_column] = None
-    df[latitude_column] = None
-
-    print(f"지오코딩 시작(provider={provider}): 총 {len(df)}개 주소 처리 중...")
-
-    for i, (idx, row) in enumerate(df.iterrows(), start=1):
-        address = row[address_column]
-        result = api.geocode_address(address)
+    # 결측/빈 주소는 미리 걸러내고, 같은 주소는 한 번만 호출해 결과를 모든 행에 매핑합니다.
+    keys = df[address_column].map(_normalize_address, na_action="ignore")
+    mask = keys.notna() & (keys != "")
+    unique_keys = keys[mask].unique()
 
-        if result:
-            df.at[idx, longitude_column] = result.get("longitude")
-            df.at[idx, latitude_column] = result.get("latitude")
+    if verbose:
+        print(
+            f"지오코딩 시작(provider={provider}): 총 {len(df)}개 주소 "
+            f"(중복 제외 {len(unique_keys)}개) 처리 중..."
+        )
 
-        if delay > 0:
-            time.sleep(delay)
+    def _fetch(addresses: List[str]) -> Dict[str, Any]:
+        if backend == "async":
+            coro = _run_async(
+                api.geocode_address_async,
+                api.headers,
+                [(address, (address,)) for address in addresses],
+                max_workers=max_workers,
+                verbose=verbose,
+                desc="지오코딩",
+            )
+            return _run_coroutine(coro)
+        tasks = [(address, (address, use_cache)) for address in addresses]
+        return _run_parallel(
+            api.geocode_address, tasks, max_workers=max_workers, verbose=verbose, desc="지오코딩"
+        )
 
-        if i % 10 == 0:
-            print(f"진행 중: {i}/{len(df)} ({(i/len(df)*100):.1f}%)")
+    cache_keys = {key: f"{api.NAME}:geocode:{key}" for key in unique_keys}
+    with api._job():
+        results = _fetch_with_cache(
+            cache if use_cache else None, cache_keys, _fetch, verbose=verbose
+        )
 
-    print(f"지오코딩 완료: {df[longitude_column].notna().sum()}개 주소 변환 성공")
+    # 좌표 컬럼은 NaN으로 채운 float64 배열에 위치 기반으로 기록 (모두 실패해도 object dtype이 되지 않음)
+    lons = np.full(len(df), np.nan, dtype=np.float64)
+    lats = np.full(len(df), np.nan, dtype=np.float64)
+    for i, key in enumerate(keys.to_numpy()):
+        result = results.get(key)
+        if result:
+            lons[i] = result["longitude"]
+            lats[i] = result["latitude"]
+    df[longitude_column] = lons
+    df[latitude_column] = lats
+    if validate_bounds:
+        df[valid_column] = _in_bounds(lons, lats)
+
+    if verbose:
+        print(f"지오코딩 완료: {df[longitude_column].notna().sum()}개 주소 변환 성공")
     return df
 
 
@@ -448,8 +907,15 @@ def reverse_geocode(
     road_address_column: str = "road_address",
     include_details: bool = True,
     save_json: Optional[Union[str, bool]] = None,
+    save_headers: bool = False,
     delay: float = 0.1,
     provider: str = "kakao",
+    max_workers: int = 8,
+    inplace: bool = False,
+    backend: str = "thread",
+    cache: Optional[GeoCache] = None,
+    use_cache: bool = True,
+    verbose: bool = True,
 ) -> pd.DataFrame:
     """
     좌표 컬럼을 주소로 변환하여 데이터프레임에 추가
@@ -462,88 +928,215 @@ def reverse_geocode(
         road_address_column: 도로명 주소 컬럼명
         include_details: 상세 정보 포함 여부
         save_json: JSON 파일 저장 옵션 (None/True/"auto"/str)
-        delay: API 호출 간 지연 시간(초)
+        save_headers: True이면 JSON 저장 시 응답 헤더 일부(Content-Type, Date 등)도 기록
+        delay: API 호출 간 지연 시간(초), 초당 1/delay회로 호출 속도를 제한 (0이면 제한 없음)
         provider: 'kakao' | 'naver'
+        max_workers: 동시에 API를 호출할 스레드 수
+        inplace: True이면 입력 데이터프레임에 직접 컬럼을 추가
+            (False이면 전체 복사본을 만들므로 대용량 입력은 True가 메모리를 절약)
+        backend: 'thread' (requests + 스레드 풀) | 'async' (httpx HTTP/2, max_workers개 동시 요청)
+        cache: 결과를 재사용할 GeoCache (None이면 영구 캐시 미사용, save_json 사용 시 무시)
+        use_cache: False이면 메모리/영구 캐시를 건너뛰고 항상 API를 호출
+        verbose: 진행 표시줄과 시작/완료 메시지 출력 여부
     """
     if longitude_column not in df.columns:
         raise ValueError(f"컬럼 '{longitude_column}'이 데이터프레임에 없습니다.")
     if latitude_column not in df.columns:
         raise ValueError(f"컬럼 '{latitude_column}'이 데이터프레임에 없습니다.")
+    if backend not in ("thread", "async"):
+        raise ValueError("backend는 'thread' 또는 'async'만 지원합니다.")
 
-    df = df.copy()
+    if not inplace:
+        df = df.copy()
     api = _get_provider(provider)
+    api.rate_limiter.set_rate(1 / delay if delay > 0 else 0)
+
+    # 같은 좌표(소수점 6자리 기준)는 한 번만 호출하고 결과를 모든 행에 매핑합니다.
+    # 숫자로 바꿀 수 없는 값("" 등)은 NaN으로 바꿔 결측 좌표와 같이 건너뜁니다.
+    lons = _to_float_array(df[longitude_column])
+    lats = _to_float_array(df[latitude_column])
+    valid = ~(np.isnan(lons) | np.isnan(lats))
+    keys = [_coord_key(lon, lat) if ok else None for ok, lon, lat in zip(valid, lons, lats)]
+    # API 요청과 JSON 기록에는 키마다 처음 나온 행의 원본 좌표를 사용합니다.
+    origins: Dict[Tuple[float, float], Tuple[float, float]] = {}
+    for key, lon, lat in zip(keys, lons, lats):
+        if key is not None:
+            origins.setdefault(key, (float(lon), float(lat)))
+    unique_keys = list(origins)
+
+    if verbose:
+        print(
+            f"역지오코딩 시작(provider={provider}): 총 {len(df)}개 좌표 "
+            f"(중복 제외 {len(unique_keys)}개) 처리 중..."
+        )
+        if include_details:
+            print("상세 정보 포함: 시도, 시군구, 읍면동리, 건물명, 우편번호 등(가능한 범위)")
 
-    df[address_column] = None
-    df[road_address_column] = None
-
-    detail_columns = [
-        "road_zone_no",
-        "road_region_1depth",
-        "road_region_2depth",
-        "road_region_3depth",
-        "road_name",
-        "road_main_building_no",
-        "road_sub_building_no",
-        "road_building_name",
-        "road_underground_yn",
-        "address_region_1depth",
-        "address_region_2depth",
-        "address_region_3depth",
-        "address_region_3depth_h",
-        "address_h_code",
-        "address_b_code",
-        "address_main_no",
-        "address_sub_no",
-        "address_mountain_yn",
-    ]
-    if include_details:
-        for col in detail_columns:
-            df[col] = None
-
-    print(f"역지오코딩 시작(provider={provider}): 총 {len(df)}개 좌표 처리 중...")
-    if include_details:
-        print("상세 정보 포함: 시도, 시군구, 읍면동리, 건물명, 우편번호 등(가능한 범위)")
-
+    # 저장되는 모든 레코드는 배치 시작 시각을 timestamp로 공유합니다.
+    started_at = datetime.now()
     json_base_path = None
     if save_json:
         if save_json is True or save_json == "auto":
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = started_at.strftime("%Y%m%d_%H%M%S")
             json_base_path = f"reverse_geocode_{provider}_{timestamp}"
         else:
             json_base_path = str(save_json)
 
-    for i, (idx, row) in enumerate(df.iterrows(), start=1):
-        lon = row[longitude_column]
-        lat = row[latitude_column]
+    # 한 행이면 단일 JSON 파일, 여러 행이면 하나의 JSON Lines 파일에 이어서 기록합니다.
+    json_path = None
+    save_fp = None
+    if json_base_path:
+        Path(json_base_path).parent.mkdir(parents=True, exist_ok=True)
+        if len(df) == 1:
+            json_path = f"{json_base_path}.json"
+        else:
+            save_fp = _BackgroundWriter(open(f"{json_base_path}.jsonl", "wb"))
 
-        json_path = None
-        if json_base_path:
-            if len(df) == 1:
-                json_path = f"{json_base_path}.json"
-            else:
-                json_path = f"{json_base_path}_{idx}.json"
+    timestamp_iso = started_at.isoformat()
 
-        result = api.reverse_geocode_coords(
-            lon, lat, include_details=include_details, save_json=json_path
+    def _fetch(coords: List[Tuple[float, float]]) -> Dict[Tuple[float, float], Any]:
+        options = dict(
+            include_details=include_details,
+            save_json=json_path,
+            save_fp=save_fp,
+            timestamp=timestamp_iso,
+            save_headers=save_headers,
+        )
+        tasks = [(key, origins[key]) for key in coords]
+        if backend == "async":
+            coro = _run_async(
+                partial(api.reverse_geocode_coords_async, **options),
+                api.headers,
+                tasks,
+                max_workers=max_workers,
+                verbose=verbose,
+                desc="역지오코딩",
+            )
+            return _run_coroutine(coro)
+        return _run_parallel(
+            partial(api.reverse_geocode_coords, use_cache=use_cache, **options),
+            tasks,
+            max_workers=max_workers,
+            verbose=verbose,
+            desc="역지오코딩",
         )
 
-        if result:
-            df.at[idx, address_column] = result.get("address", "")
-            df.at[idx, road_address_column] = result.get("road_address", "")
+    try:
+        with api._job():
+            if json_base_path:
+                # 응답을 저장해야 하므로 영구 캐시를 거치지 않습니다.
+                results = _fetch(unique_keys)
+            else:
+                suffix = int(include_details)
+                cache_keys = {
+                    (lon, lat): f"{api.NAME}:reverse:{lon:.6f},{lat:.6f}:{suffix}"
+                    for lon, lat in unique_keys
+                }
+                results = _fetch_with_cache(
+                    cache if use_cache else None, cache_keys, _fetch, verbose=verbose
+                )
+    finally:
+        if save_fp is not None:
+            save_fp.close()
 
-            if include_details:
-                for col in detail_columns:
-                    df.at[idx, col] = result.get(col, "")
+    # 결과 dict 키 → 데이터프레임 컬럼
+    output_columns = {"address": address_column, "road_address": road_address_column}
+    if include_details:
+        output_columns.update({col: col for col in _DETAIL_COLUMNS})
+
+    # 행별 결과 dict로 결과 프레임을 한 번에 만들고 (실패한 행은 빈 dict → <NA>)
+    # 주소/상세 컬럼은 pandas StringDtype으로 저장합니다.
+    records = [(results.get(key) or {}) if key is not None else {} for key in keys]
+    result_df = pd.DataFrame.from_records(
+        records, index=df.index, columns=list(output_columns)
+    )
+    result_df.columns = list(output_columns.values())
+    for col in result_df.columns:
+        df[col] = result_df[col].astype("string").array
+
+    if verbose:
+        success_count = df[road_address_column].notna().sum()
+        print(f"역지오코딩 완료: {success_count}개 좌표 변환 성공")
+    return df
 
-        if delay > 0:
-            time.sleep(delay)
 
-        if i % 10 == 0:
-            print(f"진행 중: {i}/{len(df)} ({(i/len(df)*100):.1f}%)")
+def geocode_file(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    address_column: str,
+    chunksize: int = 10_000,
+    encoding: str = "utf-8-sig",
+    **kwargs: Any,
+) -> int:
+    """
+    CSV 파일을 chunksize행씩 읽어 지오코딩하고 결과를 output_path CSV에 이어서 저장
 
-    success_count = df[road_address_column].notna().sum()
-    print(f"역지오코딩 완료: {success_count}개 좌표 변환 성공")
-    return df
+    파일 전체를 메모리에 올리지 않으므로 대용량 파일도 chunksize에 비례하는 메모리로 처리합니다.
+    나머지 인자(provider, delay, cache 등)는 geocode에 그대로 전달됩니다.
+    (청크는 파일에서 새로 읽은 데이터프레임이므로 inplace는 무시하고 항상 제자리에서 처리)
+
+    Returns:
+        처리한 행 수
+    """
+    kwargs.pop("inplace", None)
+    return _process_csv_in_chunks(
+        lambda chunk, _: geocode(chunk, address_column, inplace=True, **kwargs),
+        input_path,
+        output_path,
+        chunksize=chunksize,
+        encoding=encoding,
+        verbose=kwargs.get("verbose", True),
+    )
+
+
+def reverse_geocode_file(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    longitude_column: str,
+    latitude_column: str,
+    chunksize: int = 10_000,
+    encoding: str = "utf-8-sig",
+    save_json: Optional[Union[str, bool]] = None,
+    **kwargs: Any,
+) -> int:
+    """
+    CSV 파일을 chunksize행씩 읽어 역지오코딩하고 결과를 output_path CSV에 이어서 저장
+
+    save_json을 쓰면 청크마다 '{경로}_part0000.jsonl' 형식의 파일로 나눠 저장합니다.
+    (reverse_geocode와 같이 1행뿐인 청크(마지막 청크 등)는 '{경로}_partNNNN.json'으로 저장)
+    나머지 인자(provider, include_details, cache 등)는 reverse_geocode에 그대로 전달됩니다.
+    (inplace는 geocode_file과 같이 무시)
+
+    Returns:
+        처리한 행 수
+    """
+    kwargs.pop("inplace", None)
+    json_base_path = None
+    if save_json:
+        if save_json is True or save_json == "auto":
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            json_base_path = f"reverse_geocode_{kwargs.get('provider', 'kakao')}_{timestamp}"
+        else:
+            json_base_path = str(save_json)
+
+    def _reverse(chunk: pd.DataFrame, index: int) -> pd.DataFrame:
+        return reverse_geocode(
+            chunk,
+            longitude_column,
+            latitude_column,
+            save_json=f"{json_base_path}_part{index:04d}" if json_base_path else None,
+            inplace=True,
+            **kwargs,
+        )
+
+    return _process_csv_in_chunks(
+        _reverse,
+        input_path,
+        output_path,
+        chunksize=chunksize,
+        encoding=encoding,
+        verbose=kwargs.get("verbose", True),
+    )
 
 
 def kakao_geocode(*args, **kwargs) -> pd.DataFrame:
@@ -566,39 +1159,265 @@ def naver_reverse_geocode(*args, **kwargs) -> pd.DataFrame:
     return reverse_geocode(*args, **kwargs)
 
 
+def _run_parallel(
+    func: Callable[..., Any],
+    tasks: List[Tuple[Any, tuple]],
+    max_workers: int,
+    verbose: bool = True,
+    desc: Optional[str] = None,
+) -> Dict[Any, Any]:
+    """
+    (키, 인자) 목록을 스레드 풀에서 실행하고 {키: 결과}를 반환
+
+    API 호출은 I/O 대기가 대부분이라 스레드로 동시에 처리합니다.
+    호출 속도 제한은 각 Provider의 rate_limiter가 담당합니다.
+    """
+    results: Dict[Any, Any] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(func, *args): key for key, args in tasks}
+        progress = tqdm(total=len(futures), desc=desc, mininterval=0.5, disable=not verbose)
+        with progress:
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                progress.update()
+
+    return results
+
+
+def _process_csv_in_chunks(
+    func: Callable[[pd.DataFrame, int], pd.DataFrame],
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    chunksize: int,
+    encoding: str,
+    verbose: bool = True,
+) -> int:
+    """CSV를 청크 단위로 읽어 func(청크, 청크 번호) 결과를 output_path에 이어 쓰고 처리한 행 수를 반환"""
+    total = 0
+    with pd.read_csv(input_path, chunksize=chunksize, encoding=encoding) as reader:
+        for index, chunk in enumerate(reader):
+            result = func(chunk, index)
+            # 첫 청크는 헤더와 함께 새로 쓰고, 이후 청크는 헤더 없이 이어 씁니다.
+            result.to_csv(
+                output_path,
+                mode="w" if index == 0 else "a",
+                header=index == 0,
+                index=False,
+                encoding=encoding,
+            )
+            total += len(result)
+            if verbose:
+                print(f"청크 {index + 1} 저장 완료: 누적 {total}개 행 → {output_path}")
+    return total
+
+
+def _json_loads(content: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """UTF-8 JSON 직렬화 (indent=False이면 공백 없는 한 줄)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# 좌표 유효 범위 (대한민국 인근, WGS84): (최소 경도, 최대 경도, 최소 위도, 최대 위도)
+_KOREA_BOUNDS = (124.0, 132.0, 33.0, 39.0)
+
+
+def _in_bounds(lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+    """좌표 배열이 _KOREA_BOUNDS 안에 있는지 벡터 연산으로 검사 (NaN은 False)"""
+    min_lon, max_lon, min_lat, max_lat = _KOREA_BOUNDS
+    return (lons >= min_lon) & (lons <= max_lon) & (lats >= min_lat) & (lats <= max_lat)
+
+
+def _fetch_with_cache(
+    cache: Optional[GeoCache],
+    cache_keys: Dict[Any, str],
+    fetch: Callable[[List[Any]], Dict[Any, Any]],
+    verbose: bool = True,
+) -> Dict[Any, Any]:
+    """
+    영구 캐시에 없는 키만 fetch로 조회하고 {키: 결과}를 반환
+
+    cache_keys는 {입력 키: 캐시 키}이며, 새로 얻은 성공 결과는 한 트랜잭션으로 저장합니다.
+    조회할 키가 없으면 fetch를 호출하지 않습니다 (빈 진행 표시줄/HTTP 클라이언트 생성 방지).
+    """
+    if cache is None:
+        return fetch(list(cache_keys)) if cache_keys else {}
+
+    results: Dict[Any, Any] = {}
+    misses = []
+    for key, cache_key in cache_keys.items():
+        hit = cache.get(cache_key)
+        if hit is None:
+            misses.append(key)
+        else:
+            results[key] = hit
+
+    if results and verbose:
+        print(f"캐시 적중: {len(results)}개 (API 호출 {len(misses)}개)")
+    if not misses:
+        return results
+
+    fetched = fetch(misses)
+    with cache.batch():
+        for key, value in fetched.items():
+            if value:
+                cache.set(cache_keys[key], value)
+
+    results.update(fetched)
+    return results
+
+
+async def _run_async(
+    func: Callable[..., Any],
+    headers: Dict[str, str],
+    tasks: List[Tuple[Any, tuple]],
+    max_workers: int,
+    verbose: bool = True,
+    desc: Optional[str] = None,
+) -> Dict[Any, Any]:
+    """
+    _run_parallel의 비동기 버전: httpx.AsyncClient(HTTP/2)로 func(client, *인자)를 동시에 실행
+
+    HTTP/2 다중화로 동시 요청들이 하나의 TLS 연결을 공유하며,
+    동시 요청 수는 max_workers로 제한합니다.
+    """
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "backend='async'를 사용하려면 httpx가 필요합니다. "
+            "pip install 'httpx[http2]'로 설치하세요."
+        )
+
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+    async with httpx.AsyncClient(
+        http2=True, limits=limits, timeout=_REQUEST_TIMEOUT, headers=headers
+    ) as client:
+        progress = tqdm(total=len(tasks), desc=desc, mininterval=0.5, disable=not verbose)
+        with progress:
+
+            async def _bounded(args: tuple) -> Any:
+                async with semaphore:
+                    result = await func(client, *args)
+                progress.update()
+                return result
+
+            values = await asyncio.gather(*(_bounded(args) for _, args in tasks))
+
+    return {key: value for (key, _), value in zip(tasks, values)}
+
+
+def _run_coroutine(coro: Any) -> Any:
+    """코루틴을 동기적으로 실행 (Jupyter 등 실행 중인 이벤트 루프가 있으면 별도 스레드 사용)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class _BytesWriter(Protocol):
+    """JSON Lines 기록 대상 (_BackgroundWriter 등 write(bytes)를 지원하는 객체)"""
+
+    def write(self, data: bytes) -> Any: ...
+
+
+class _BackgroundWriter:
+    """
+    파일 쓰기를 전용 스레드 하나로 넘기는 래퍼
+
+    write()는 쓰기 작업을 큐에 넣고 바로 반환하므로 API 호출 스레드가 디스크 I/O를 기다리지 않습니다.
+    단일 스레드에서 제출 순서대로 기록하며, close()는 남은 쓰기를 모두 마친 뒤 파일을 닫고
+    쓰기 중 오류(디스크 부족 등)가 있었다면 첫 번째 오류를 다시 발생시킵니다.
+    """
+
+    def __init__(self, fp: IO[bytes]):
+        self._fp = fp
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="json-writer")
+        self._error: Optional[BaseException] = None
+
+    def write(self, data: bytes) -> None:
+        self._executor.submit(self._fp.write, data).add_done_callback(self._record_error)
+
+    def _record_error(self, future: Any) -> None:
+        if self._error is None and future.exception() is not None:
+            self._error = future.exception()
+
+    def close(self) -> None:
+        try:
+            self._executor.shutdown(wait=True)
+        finally:
+            self._fp.close()
+        if self._error is not None:
+            raise self._error
+
+
+# JSON 저장 시 기록할 응답 헤더 (전체 헤더는 행마다 반복되는 값이 대부분이라 제외)
+_SAVED_RESPONSE_HEADERS = ("Content-Type", "Date", "X-Ratelimit-Remaining")
+
+
 def _save_api_json(
-    save_json: str,
+    save_json: Optional[str],
     request_url: str,
     request_params: Dict[str, Any],
     longitude: float,
     latitude: float,
     response: requests.Response,
     data: Any,
+    save_fp: Optional[_BytesWriter] = None,
+    timestamp: Optional[str] = None,
+    save_headers: bool = False,
 ) -> None:
-    json_data = {
+    """
+    API 요청/응답 저장
+
+    save_fp가 주어지면 열린 파일에 JSON Lines 한 줄로 이어 쓰고,
+    아니면 save_json 경로에 단일 JSON 파일로 저장합니다. (상위 디렉토리는 호출 측에서 생성)
+    timestamp를 주지 않으면 저장 시각을 사용하고,
+    응답 헤더는 save_headers=True일 때만 일부(_SAVED_RESPONSE_HEADERS)를 기록합니다.
+    """
+    json_data: Dict[str, Any] = {
         "request": {
             "url": request_url,
             "params": request_params,
             "longitude": longitude,
             "latitude": latitude,
-            "timestamp": datetime.now().isoformat(),
-        },
-        "response": {
-            "status_code": response.status_code,
-            "headers": dict(response.headers),
-            "data": data,
+            "timestamp": timestamp or datetime.now().isoformat(),
         },
+        "response": {"status_code": response.status_code},
     }
+    if save_headers:
+        headers = response.headers
+        json_data["response"]["headers"] = {
+            k: headers.get(k) for k in _SAVED_RESPONSE_HEADERS if k in headers
+        }
+    json_data["response"]["data"] = data
+
+    if save_fp is not None:
+        save_fp.write(_json_dumps(json_data) + b"\n")
+        return
 
-    json_path = Path(save_json)
-    json_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(json_data, f, ensure_ascii=False, indent=2)
+    Path(save_json).write_bytes(_json_dumps(json_data, indent=True))
 
 
 def _print_kakao_403_details(response: requests.Response, api_key: str, context: str) -> None:
     try:
-        error_data = response.json()
+        error_data = _json_loads(response.content)
         error_msg = error_data.get("msg", "알 수 없는 오류")
         error_code = error_data.get("code", "")
         print(f"{context} 오류 (403 Forbidden): {error_msg} (코드: {error_code})")
@@ -612,13 +1431,6 @@ def _print_kakao_403_details(response: requests.Response, api_key: str, context:
         print(f"현재 사용 중인 API 키(일부): {api_key[:10]}...")
 
 
-def _pick_naver_result(results: list, name: str) -> Optional[dict]:
-    for r in results:
-        if isinstance(r, dict) and r.get("name") == name:
-            return r
-    return None
-
-
 def _naver_result_text(result: Optional[dict]) -> str:
     if not result or not isinstance(result, dict):
         return ""
@@ -674,7 +1486,7 @@ def _print_naver_auth_error(response: requests.Response) -> None:
     - 403: 권한/상품 미활성화/허용 정책(IP 등) 문제 가능
     """
     try:
-        body = response.json()
+        body = _json_loads(response.content)
     except Exception:
         body = response.text
 
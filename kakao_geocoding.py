@@ -23,6 +23,7 @@ def geocode(
     longitude_column: str = "longitude",
     latitude_column: str = "latitude",
     delay: float = 0.1,
+    max_workers: int = 8,
 ) -> pd.DataFrame:
     return _geocode(
         df=df,
@@ -31,6 +32,7 @@ def geocode(
         latitude_column=latitude_column,
         delay=delay,
         provider="kakao",
+        max_workers=max_workers,
     )
 
 
@@ -42,7 +44,9 @@ def reverse_geocode(
     road_address_column: str = "road_address",
     include_details: bool = True,
     save_json: Optional[Union[str, bool]] = None,
+    save_headers: bool = False,
     delay: float = 0.1,
+    max_workers: int = 8,
 ) -> pd.DataFrame:
     return _reverse_geocode(
         df=df,
@@ -52,6 +56,8 @@ def reverse_geocode(
         road_address_column=road_address_column,
         include_details=include_details,
         save_json=save_json,
+        save_headers=save_headers,
         delay=delay,
         provider="kakao",
+        max_workers=max_workers,
     )